@@ -3,6 +3,7 @@
 from __future__ import annotations
 import math
 import pathlib
+import numpy as np
 
 import ezdxf
 from ezdxf.layouts import Paperspace, Modelspace
@@ -22,6 +23,8 @@ if not CWD.exists():
 # ------------------------------------------------------------------------------
 
 MESH_SIZE = 20
+# shared by all created DXF versions, add_text() does not modify this dict
+TEXT_ATTRIBS = {"style": "OpenSans-Bold", "color": colors.BLUE}
 
 
 def build_cos_sin_mesh(mesh):
@@ -30,13 +33,14 @@ def build_cos_sin_mesh(mesh):
     dy = 30
 
     delta = math.pi / MESH_SIZE
-    for x in range(MESH_SIZE):
-        sinx = math.sin(float(x) * delta)
-        for y in range(MESH_SIZE):
-            cosy = math.cos(float(y) * delta)
-            z = sinx * cosy * height
-            # set the m,n vertex to 3d point x,y,z
-            mesh.set_mesh_vertex((x, y), (dx + x, dy + y, z))
+    steps = np.arange(MESH_SIZE, dtype=np.float64)
+    # the m,n vertex is located at the 3d point x,y,z:
+    grid = np.empty((MESH_SIZE, MESH_SIZE, 3), dtype=np.float64)
+    grid[:, :, 0] = dx + steps[:, np.newaxis]
+    grid[:, :, 1] = dy + steps[np.newaxis, :]
+    grid[:, :, 2] = np.outer(np.sin(steps * delta), np.cos(steps * delta)) * height
+    # set all mesh vertices at once in row-major order
+    mesh.set_mesh_vertices(grid.reshape(-1, 3))
 
 
 def create_2d_modelspace_content(msp: Modelspace):
@@ -60,83 +64,52 @@ def create_3d_modelspace_content(msp: Modelspace):
     build_cos_sin_mesh(mesh)
 size = (44.0, 46.5)
 center = (27.0, 25.75)
-def create_viewports(paperspace: Paperspace):
-    # Define viewports in paper space:
-    # center, size=(width, height) defines the viewport in paper space.
-    # view_center_point and view_height defines the area in model space
-    # which is displayed in the viewport.
-    txt_attribs = dict(
-        style="OpenSans-Bold",
-        color=colors.BLUE,
-    )
-    paperspace.add_viewport(
-        center=(2.5, 2.5),
-        size=(5, 5),
-        view_center_point=(7.5, 7.5),
-        view_height=10,
-        status=2,
-    ) 
-    # scale is calculated by:
-    # height of model space (view_height=10) / height of viewport (height=5)
-    paperspace.add_text(
-        "View of Rectangle Scale=1:2", height=0.18, dxfattribs=txt_attribs
-    ).set_placement((0, 5.2))
-
-    paperspace.add_viewport(
-        center=(8.5, 2.5),
-        size=(5, 5),
-        view_center_point=(10, 5),
-        view_height=25,
-        status=3,
-    )
-    paperspace.add_text(
-        "View of Circle Scale=1:5", height=0.18, dxfattribs=txt_attribs
-    ).set_placement((6, 5.2))
-
-    paperspace.add_viewport(
-        center=(14.5, 2.5),
-        size=(5, 5),
-        view_center_point=(12.5, 7.5),
-        view_height=5,
-        status=4,
-    )
-    paperspace.add_text(
-        "View of Triangle Scale=1:1", height=0.18, dxfattribs=txt_attribs
-    ).set_placement((12, 5.2))
-
-    paperspace.add_viewport(
-        center=(7.5, 10),
-        size=(15, 7.5),
-        view_center_point=(10, 6.25),
-        view_height=7.5,
-        status=5,
-    )
-    paperspace.add_text(
-        "Overall View Scale=1:1", height=0.18, dxfattribs=txt_attribs
-    ).set_placement((0, 14))
-
-    paperspace.add_viewport(
-        center=(16, 13.5),
-        size=(0.3, 0.15),
-        view_center_point=(10, 6.25),
-        view_height=7.5,
-        status=6,
-    )
+# Viewport definitions in paper space:
+# center, size=(width, height) defines the viewport in paper space.
+# view_center_point and view_height defines the area in model space
+# which is displayed in the viewport.
+# The scale is calculated by: view_height / height of viewport, e.g.
+# view_height=10 / height=5 is a scale of 1:2
+# columns: center, size, view_center_point, view_height, label,
+# label location, label alignment
+# fmt: off
+VIEWPORTS = [
+    ((2.5, 2.5), (5, 5), (7.5, 7.5), 10, "View of Rectangle Scale=1:2", (0, 5.2), None),
+    ((8.5, 2.5), (5, 5), (10, 5), 25, "View of Circle Scale=1:5", (6, 5.2), None),
+    ((14.5, 2.5), (5, 5), (12.5, 7.5), 5, "View of Triangle Scale=1:1", (12, 5.2), None),
+    ((7.5, 10), (15, 7.5), (10, 6.25), 7.5, "Overall View Scale=1:1", (0, 14), None),
     # scale = 7.5/0.15 = 50
-    paperspace.add_text(
-        "Scale=1:50", height=0.18, dxfattribs=txt_attribs
-    ).set_placement((16, 14), align=TextEntityAlignment.CENTER)
+    ((16, 13.5), (0.3, 0.15), (10, 6.25), 7.5, "Scale=1:50", (16, 14),
+     TextEntityAlignment.CENTER),
+    ((16, 10), (4, 4), (0, 0), 30, "Viewport to 3D Mesh", (16, 10),
+     TextEntityAlignment.CENTER),
+]
+# fmt: on
 
-    vp = paperspace.add_viewport(
-        center=(16, 10), size=(4, 4), view_center_point=(0, 0), view_height=30, status=7
-    )
+
+def create_viewports(paperspace: Paperspace):
+    add_viewport = paperspace.add_viewport
+    add_text = paperspace.add_text
+    # status 1 is reserved for the paper space viewport itself
+    for status, row in enumerate(VIEWPORTS, start=2):
+        center, size, view_center, view_height, label, location, align = row
+        vp = add_viewport(
+            center=center,
+            size=size,
+            view_center_point=view_center,
+            view_height=view_height,
+            status=status,
+        )
+        text = add_text(label, height=0.18, dxfattribs=TEXT_ATTRIBS)
+        if align is None:
+            text.set_placement(location)
+        else:
+            text.set_placement(location, align=align)
+
+    # the last viewport shows the 3D mesh from an isometric view direction
     vp.dxf.view_target_point = (40, 40, 0)
     vp.dxf.view_direction_vector = (-1, -1, 1)
 
-    paperspace.add_text(
-        "Viewport to 3D Mesh", height=0.18, dxfattribs=txt_attribs
-    ).set_placement((16, 10), align=TextEntityAlignment.CENTER)
-
 
 def draw_border_lines(psp: Paperspace, start: Vec2, size: Vec2):
     rect = forms.box(size.x, size.y)
@@ -71,23 +71,13 @@ def create_doc(filename):
         )
 
     def show_insert_points(msp):
+        insert_attribs = {"color": 1, "layer": "INSERT_POINTS"}
+        align_attribs = {"color": 2, "layer": "INSERT_POINTS"}
+        add_circle = msp.add_circle
         for text in msp.query("TEXT"):
-            msp.add_circle(
-                text.dxf.insert,
-                radius=0.1,
-                dxfattribs={
-                    "color": 1,
-                    "layer": "INSERT_POINTS",
-                },
-            )
-            msp.add_circle(
-                text.dxf.align_point,
-                radius=0.075,
-                dxfattribs={
-                    "color": 2,
-                    "layer": "INSERT_POINTS",
-                },
-            )
+            dxf = text.dxf
+            add_circle(dxf.insert, radius=0.1, dxfattribs=insert_attribs)
+            add_circle(dxf.align_point, radius=0.075, dxfattribs=align_attribs)
 
     def shift_insert_point(msp):
         for text in msp.query("TEXT"):
@@ -1,6 +1,11 @@
 #  Copyright (c) 2022, Manfred Moitzi
 #  License: MIT License
+from typing import Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import functools
+import os
 import subprocess
 import shlex
 import shutil
@@ -11,27 +16,74 @@ POSIX = sys.platform != "win32"
 if POSIX:
     PYTHON3 = shutil.which("python3")
 
+EXAMPLES_DXF = Path(__file__).parent
+IMPORTER_TEST_FILES = ["wipeout_door.dxf", "dimension_in_nested_blocks.dxf"]
 
-def main():
-    filepath = Path(__file__)
-    for script in filepath.parent.glob("create_*.py"):
-        cmd = f"{PYTHON3} {script}"
-        print(f'executing: "{cmd}"')
-        args = shlex.split(cmd, posix=POSIX)
-        subprocess.run(args)
 
+def run_script(script: Path) -> int:
+    cmd = f"{PYTHON3} {script}"
+    print(f'executing: "{cmd}"')
+    args = shlex.split(cmd, posix=POSIX)
+    return subprocess.run(args).returncode
 
-if __name__ == "__main__":
-    from ezdxf.addons.importer import Importer
+
+def main(jobs: Optional[int] = None):
+    # The scripts are independent of each other and the work is done by
+    # subprocesses, threads are sufficient to run them in parallel.
+    scripts = sorted(EXAMPLES_DXF.glob("create_*.py"))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        returncodes = list(executor.map(run_script, scripts))
+    failed = [
+        script.name for script, code in zip(scripts, returncodes) if code != 0
+    ]
+    print(f"\nexecuted {len(scripts)} scripts, {len(failed)} failed")
+    for name in failed:
+        print(f"failed: {name}")
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_read(filepath: str, mtime: float):
+    # The modification time is part of the cache key to reload changed files.
     import ezdxf
-    dimdoc = ezdxf.readfile(r'D:\._vscode2\ezdxf-sorc\examples_dxf\wipeout_door.dxf')
-    newdoc = ezdxf.new(dxfversion=dimdoc.dxfversion, setup=True)
-    imper =  Importer(dimdoc, newdoc)
 
-    dimdoc2 = ezdxf.readfile(r'D:\._vscode2\ezdxf-sorc\examples_dxf\dimension_in_nested_blocks.dxf')
-    newdoc2 = ezdxf.new(dxfversion=dimdoc.dxfversion, setup=True)
-    imper2 =  Importer(dimdoc2, newdoc2)
+    return ezdxf.readfile(filepath)
+
+
+def readfile(filepath: Path):
+    return _cached_read(str(filepath), filepath.stat().st_mtime)
 
 
-    print('')
-    main()
+def _run_selftest():
+    import ezdxf
+    from ezdxf.addons.importer import Importer
+
+    for name in IMPORTER_TEST_FILES:
+        try:
+            source = readfile(EXAMPLES_DXF / name)
+        except FileNotFoundError:
+            print(f"skipped missing file: {name}")
+            continue
+        target = ezdxf.new(dxfversion=source.dxfversion, setup=True)
+        Importer(source, target)
+        print(f"importer setup: {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="count of scripts to run in parallel, default is the CPU count",
+    )
+    parser.add_argument(
+        "--selftest",
+        action="store_true",
+        help="run only the importer setup for the example DXF files",
+    )
+    args = parser.parse_args()
+    if args.selftest:
+        _run_selftest()
+        sys.exit(0)
+    main(max(args.jobs, 1))
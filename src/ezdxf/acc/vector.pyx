@@ -5,6 +5,7 @@
 from typing import Iterable, List, Sequence, TYPE_CHECKING, Tuple, Iterator
 from libc.math cimport fabs, sin, cos, M_PI, hypot, atan2, acos, sqrt, fmod
 import random
+import numpy as np
 
 cdef extern from "constants.h":
     const double ABS_TOL
@@ -113,6 +114,9 @@ cdef class Vec2:
 
     @staticmethod
     def generate(items: Iterable[UVec]) -> Iterator[Vec2]:
+        if isinstance(items, np.ndarray):
+            # converting the rows of numpy arrays is very slow
+            items = items.tolist()
         return (Vec2(item) for item in items)
 
     @staticmethod
@@ -179,15 +183,17 @@ cdef class Vec2:
         return v2_ortho(self, ccw)
 
     def lerp(self, other: "AnyVec", double factor = 0.5) -> Vec2:
-        cdef Vec2 o = Vec2(other)
-        return v2_lerp(self, o, factor)
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        return v2_lerp(self, <Vec2> other, factor)
 
     def normalize(self, double length = 1.) -> Vec2:
         return v2_normalize(self, length)
 
     def project(self, other: AnyVec) -> Vec2:
-        cdef Vec2 o = Vec2(other)
-        return v2_project(self, o)
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        return v2_project(self, <Vec2> other)
 
     def __neg__(self) -> Vec2:
         cdef Vec2 res = Vec2()
@@ -202,21 +208,22 @@ cdef class Vec2:
 
     def isclose(self, other: UVec, *, double rel_tol=REL_TOL,
                 double abs_tol = ABS_TOL) -> bool:
-        cdef Vec2 o = Vec2(other)
-        return isclose(self.x, o.x, rel_tol, abs_tol) and \
-               isclose(self.y, o.y, rel_tol, abs_tol)
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        return v2_isclose(self, <Vec2> other, rel_tol, abs_tol)
 
     def __eq__(self, other: UVec) -> bool:
         if not isinstance(other, Vec2):
             other = Vec2(other)
-        return self.x == other.x and self.y == other.y
+        return self.x == (<Vec2> other).x and self.y == (<Vec2> other).y
 
     def __lt__(self, other) -> bool:
-        cdef Vec2 o = Vec2(other)
-        if self.x == o.x:
-            return self.y < o.y
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        if self.x == (<Vec2> other).x:
+            return self.y < (<Vec2> other).y
         else:
-            return self.x < o.x
+            return self.x < (<Vec2> other).x
 
     def __add__(self, other: AnyVec) -> Vec2:
         if not isinstance(other, Vec2):
@@ -258,25 +265,32 @@ cdef class Vec2:
     # __rtruediv__ not supported -> TypeError
 
     def dot(self, other: AnyVec) -> float:
-        cdef Vec2 o = Vec2(other)
-        return v2_dot(self, o)
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        return v2_dot(self, <Vec2> other)
 
     def det(self, other: AnyVec) -> float:
-        cdef Vec2 o = Vec2(other)
-        return v2_det(self, o)
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        return v2_det(self, <Vec2> other)
 
     def distance(self, other: AnyVec) -> float:
-        cdef Vec2 o = Vec2(other)
-        return v2_dist(self, o)
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        return v2_dist(self, <Vec2> other)
 
     def angle_between(self, other: AnyVec) -> float:
-        cdef Vec2 o = Vec2(other)
-        return v2_angle_between(self, o)
+        if not isinstance(other, Vec2):
+            other = Vec2(other)
+        return v2_angle_between(self, <Vec2> other)
 
     def rotate(self, double angle) -> Vec2:
-        cdef double self_angle = atan2(self.y, self.x)
-        cdef double magnitude = hypot(self.x, self.y)
-        return v2_from_angle(self_angle + angle, magnitude)
+        cdef double c = cos(angle)
+        cdef double s = sin(angle)
+        cdef Vec2 res = Vec2()
+        res.x = c * self.x - s * self.y
+        res.y = s * self.x + c * self.y
+        return res
 
     def rotate_deg(self, double angle) -> Vec2:
         return self.rotate(angle * DEG2RAD)
@@ -328,7 +342,7 @@ cdef Vec2 v2_from_angle(double angle, double length):
     return res
 
 cdef double v2_angle_between(Vec2 a, Vec2 b) except -1000:
-    cdef double cos_theta = v2_dot(v2_normalize(a, 1.0), v2_normalize(b, 1.0))
+    cdef double cos_theta = v2_dot(a, b) / (hypot(a.x, a.y) * hypot(b.x, b.y))
     # avoid domain errors caused by floating point imprecision:
     if cos_theta < -1.0:
         cos_theta = -1.0
@@ -337,7 +351,10 @@ cdef double v2_angle_between(Vec2 a, Vec2 b) except -1000:
     return acos(cos_theta)
 
 cdef Vec2 v2_normalize(Vec2 a, double length):
-    cdef double factor = length / hypot(a.x, a.y)
+    cdef double magnitude = hypot(a.x, a.y)
+    if magnitude == length and magnitude != 0.0:
+        return a  # immutable
+    cdef double factor = length / magnitude
     cdef Vec2 res = Vec2()
     res.x = a.x * factor
     res.y = a.y * factor
@@ -465,8 +482,27 @@ cdef class Vec3:
 
     @staticmethod
     def generate(items: Iterable[UVec]) -> Iterator[Vec3]:
+        if isinstance(items, np.ndarray):
+            # converting the rows of numpy arrays is very slow
+            items = items.tolist()
         return (Vec3(item) for item in items)
 
+    @staticmethod
+    def array(items: Iterable[UVec]) -> np.ndarray:
+        cdef Vec3 v
+        if isinstance(items, np.ndarray) and items.ndim == 2:
+            if items.shape[1] == 3:
+                return np.array(items, dtype=np.float64)
+            if items.shape[1] == 2:
+                vertices = np.zeros((len(items), 3), dtype=np.float64)
+                vertices[:, :2] = items
+                return vertices
+        coords = []
+        for item in items:
+            v = item if isinstance(item, Vec3) else Vec3(item)
+            coords.append((v.x, v.y, v.z))
+        return np.array(coords, dtype=np.float64).reshape(-1, 3)
+
     @staticmethod
     def from_angle(double angle, double length = 1.0) -> Vec3:
         return v3_from_angle(angle, length)
@@ -541,16 +577,17 @@ cdef class Vec3:
 
     def is_parallel(self, other: UVec, *, double rel_tol=REL_TOL,
                     double abs_tol = ABS_TOL) -> bool:
-        cdef Vec3 o = Vec3(other)
+        if not isinstance(other, Vec3):
+            other = Vec3(other)
         cdef Vec3 v1 = v3_normalize(self, 1.0)
-        cdef Vec3 v2 = v3_normalize(o, 1.0)
+        cdef Vec3 v2 = v3_normalize(<Vec3> other, 1.0)
         cdef Vec3 neg_v2 = v3_reverse(v2)
         return v3_isclose(v1, v2, rel_tol, abs_tol) or \
                v3_isclose(v1, neg_v2, rel_tol, abs_tol)
 
     @property
     def spatial_angle(self) -> float:
-        return acos(v3_dot(<Vec3> X_AXIS, v3_normalize(self, 1.0)))
+        return acos(self.x / v3_magnitude(self))
 
     @property
     def spatial_angle_deg(self) -> float:
@@ -598,7 +635,8 @@ cdef class Vec3:
     def __eq__(self, other: UVec) -> bool:
         if not isinstance(other, Vec3):
             other = Vec3(other)
-        return self.x == other.x and self.y == other.y and self.z == other.z
+        return self.x == (<Vec3> other).x and self.y == (<Vec3> other).y and \
+               self.z == (<Vec3> other).z
 
     def __lt__(self, other: UVec) -> bool:
         if not isinstance(other, Vec3):
@@ -660,37 +698,45 @@ cdef class Vec3:
         cdef Vec3 res = Vec3()
         cdef Vec3 tmp
         for v in items:
-            tmp = Vec3(v)
+            tmp = v if isinstance(v, Vec3) else Vec3(v)
             res.x += tmp.x
             res.y += tmp.y
             res.z += tmp.z
         return res
 
     def dot(self, other: UVec) -> float:
-        cdef Vec3 o = Vec3(other)
-        return v3_dot(self, o)
+        if not isinstance(other, Vec3):
+            other = Vec3(other)
+        return v3_dot(self, <Vec3> other)
 
     def cross(self, other: UVec) -> Vec3:
-        cdef Vec3 o = Vec3(other)
-        return v3_cross(self, o)
+        if not isinstance(other, Vec3):
+            other = Vec3(other)
+        return v3_cross(self, <Vec3> other)
 
     def distance(self, other: UVec) -> float:
-        cdef Vec3 o = Vec3(other)
-        return v3_dist(self, o)
+        if not isinstance(other, Vec3):
+            other = Vec3(other)
+        return v3_dist(self, <Vec3> other)
 
     def angle_between(self, other: UVec) -> float:
-        cdef Vec3 o = Vec3(other)
-        return v3_angle_between(self, o)
+        if not isinstance(other, Vec3):
+            other = Vec3(other)
+        return v3_angle_between(self, <Vec3> other)
 
     def angle_about(self, base: UVec, target: UVec) -> float:
-        cdef Vec3 b = Vec3(base)
-        cdef Vec3 t = Vec3(target)
-        return v3_angle_about(self, b, t)
+        if not isinstance(base, Vec3):
+            base = Vec3(base)
+        if not isinstance(target, Vec3):
+            target = Vec3(target)
+        return v3_angle_about(self, <Vec3> base, <Vec3> target)
 
     def rotate(self, double angle) -> Vec3:
-        cdef double angle_ = atan2(self.y, self.x) + angle
-        cdef double magnitude_ = hypot(self.x, self.y)
-        cdef Vec3 res = Vec3.from_angle(angle_, magnitude_)
+        cdef double c = cos(angle)
+        cdef double s = sin(angle)
+        cdef Vec3 res = Vec3()
+        res.x = c * self.x - s * self.y
+        res.y = s * self.x + c * self.y
         res.z = self.z
         return res
 
@@ -769,7 +815,7 @@ cdef Vec3 v3_from_angle(double angle, double length):
 
 
 cdef double v3_angle_between(Vec3 a, Vec3 b) except -1000:
-    cdef double cos_theta = v3_dot(v3_normalize(a, 1.0), v3_normalize(b, 1.0))
+    cdef double cos_theta = v3_dot(a, b) / (v3_magnitude(a) * v3_magnitude(b))
     # avoid domain errors caused by floating point imprecision:
     if cos_theta < -1.0:
         cos_theta = -1.0
@@ -787,7 +833,10 @@ cdef double v3_angle_about(Vec3 a, Vec3 base, Vec3 target):
 
 
 cdef Vec3 v3_normalize(Vec3 a, double length):
-    cdef double factor = length / v3_magnitude(a)
+    cdef double magnitude = v3_magnitude(a)
+    if magnitude == length and magnitude != 0.0:
+        return a  # immutable
+    cdef double factor = length / magnitude
     cdef Vec3 res = Vec3()
     res.x = a.x * factor
     res.y = a.y * factor
@@ -864,10 +864,34 @@ class Polymesh(Polyline):
             dxfattribs: dict of DXF attributes
 
         """
-        dxfattribs = dict(dxfattribs or {})
-        dxfattribs["location"] = point
         vertex = self.get_mesh_vertex(pos)
-        vertex.update_dxf_attribs(dxfattribs)
+        if dxfattribs:
+            dxfattribs = dict(dxfattribs)
+            dxfattribs["location"] = point
+            vertex.update_dxf_attribs(dxfattribs)
+        else:
+            vertex.dxf.location = point
+
+    def set_mesh_vertices(self, points: Iterable[UVec]) -> None:
+        """Set the location of all mesh vertices at once. The `points` are
+        expected in row-major order: (0, 0), (0, 1), ..., (1, 0), (1, 1), ...
+
+        Args:
+            points: iterable of (x, y, z) tuples, count has to be
+                :attr:`m_count` x :attr:`n_count`
+
+        Raises:
+            DXFValueError: invalid count of points
+
+        """
+        vertices = self.vertices
+        locations = Vec3.list(points)
+        if len(locations) != len(vertices):
+            raise const.DXFValueError(
+                f"expected {len(vertices)} points, got {len(locations)}"
+            )
+        for vertex, location in zip(vertices, locations):
+            vertex.dxf.location = location
 
     def get_mesh_vertex(self, pos: tuple[int, int]) -> DXFVertex:
         """Get location of a single mesh vertex.
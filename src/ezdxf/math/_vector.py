@@ -12,6 +12,8 @@ from typing import (
 from functools import partial
 import math
 import random
+import numpy as np
+import numpy.typing as npt
 
 if TYPE_CHECKING:
     from ezdxf.math import UVec, AnyVec
@@ -67,10 +69,14 @@ class Vec3:
 
     """
 
-    __slots__ = ["_x", "_y", "_z"]
+    __slots__ = ["_x", "_y", "_z", "_mag", "_unit", "_hash"]
 
     def __init__(self, *args):
         self._x, self._y, self._z = self.decompose(*args)
+        # lazy evaluated cache for magnitude, unit vector and hash value:
+        self._mag: Optional[float] = None
+        self._unit: Optional[Vec3] = None
+        self._hash: Optional[int] = None
 
     @property
     def x(self) -> float:
@@ -90,7 +96,7 @@ class Vec3:
     @property
     def xy(self) -> Vec3:
         """Vec3 as ``(x, y, 0)``, projected on the xy-plane."""
-        return self.__class__(self._x, self._y)
+        return _new_vec3(self.__class__, self._x, self._y, 0.0)
 
     @property
     def xyz(self) -> tuple[float, float, float]:
@@ -141,8 +147,28 @@ class Vec3:
     @classmethod
     def generate(cls, items: Iterable[UVec]) -> Iterator[Vec3]:
         """Returns an iterable of :class:`Vec3` objects."""
+        if isinstance(items, np.ndarray):
+            # converting the rows of numpy arrays is very slow
+            items = items.tolist()
         return (cls(item) for item in items)
 
+    @classmethod
+    def array(cls, items: Iterable[UVec]) -> npt.NDArray[np.float64]:
+        """Returns the `items` as numpy array of shape (N, 3) without creating
+        :class:`Vec3` objects, 2D items get a z-axis of ``0``.
+        """
+        if isinstance(items, np.ndarray) and items.ndim == 2:
+            if items.shape[1] == 3:
+                return np.array(items, dtype=np.float64)
+            if items.shape[1] == 2:
+                vertices = np.zeros((len(items), 3), dtype=np.float64)
+                vertices[:, :2] = items
+                return vertices
+        decompose = cls.decompose
+        return np.array(
+            [decompose(item) for item in items], dtype=np.float64
+        ).reshape(-1, 3)
+
     @classmethod
     def from_angle(cls, angle: float, length: float = 1.0) -> Vec3:
         """Returns a :class:`Vec3` object from `angle` in radians in the
@@ -224,7 +250,11 @@ class Vec3:
         """Returns hash value of vector, enables the usage of vector as key in
         ``set`` and ``dict``.
         """
-        return hash(self.xyz)
+        h = self._hash
+        if h is None:
+            h = hash((self._x, self._y, self._z))
+            self._hash = h
+        return h
 
     def copy(self) -> Vec3:
         """Returns a copy of vector as :class:`Vec3` object."""
@@ -236,6 +266,21 @@ class Vec3:
         """:func:`copy.deepcopy` support."""
         return self  # immutable!
 
+    def __reduce__(self):
+        # the lazy evaluated caches are not serialized
+        return self.__class__, (self._x, self._y, self._z)
+
+    def __setstate__(self, state) -> None:
+        # support for pickles created without __reduce__(), which store
+        # only the slots _x, _y and _z as state
+        _, slots = state
+        self._x = slots["_x"]
+        self._y = slots["_y"]
+        self._z = slots["_z"]
+        self._mag = None
+        self._unit = None
+        self._hash = None
+
     def __getitem__(self, index: int) -> float:
         """Support for indexing:
 
@@ -268,7 +313,11 @@ class Vec3:
     @property
     def magnitude(self) -> float:
         """Length of vector."""
-        return self.magnitude_square**0.5
+        mag = self._mag
+        if mag is None:
+            mag = math.hypot(self._x, self._y, self._z)
+            self._mag = mag
+        return mag
 
     @property
     def magnitude_xy(self) -> float:
@@ -305,7 +354,7 @@ class Vec3:
     @property
     def spatial_angle(self) -> float:
         """Spatial angle between vector and x-axis in radians."""
-        return math.acos(X_AXIS.dot(self.normalize()))
+        return math.acos(self._x / self.magnitude)
 
     @property
     def spatial_angle_deg(self) -> float:
@@ -330,9 +379,9 @@ class Vec3:
 
         """
         return (
-            self.__class__(-self._y, self._x, self._z)
+            _new_vec3(self.__class__, -self._y, self._x, self._z)
             if ccw
-            else self.__class__(self._y, -self._x, self._z)
+            else _new_vec3(self.__class__, self._y, -self._x, self._z)
         )
 
     def lerp(self, other: UVec, factor=0.5) -> Vec3:
@@ -344,8 +393,17 @@ class Vec3:
                 0.5 = mid point)
 
         """
-        d = (self.__class__(other) - self) * float(factor)
-        return self.__add__(d)
+        factor = float(factor)
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
+        return _new_vec3(
+            self.__class__,
+            self._x + (x - self._x) * factor,
+            self._y + (y - self._y) * factor,
+            self._z + (z - self._z) * factor,
+        )
 
     def project(self, other: UVec) -> Vec3:
         """Returns projected vector of `other` onto `self`."""
@@ -354,11 +412,20 @@ class Vec3:
 
     def normalize(self, length: float = 1.0) -> Vec3:
         """Returns normalized vector, optional scaled by `length`."""
-        return self.__mul__(length / self.magnitude)
+        magnitude = self.magnitude
+        if magnitude == length and magnitude != 0.0:
+            return self  # immutable!
+        if length == 1.0:
+            unit = self._unit
+            if unit is None:
+                unit = self.__mul__(1.0 / magnitude)
+                self._unit = unit
+            return unit
+        return self.__mul__(length / magnitude)
 
     def reversed(self) -> Vec3:
         """Returns negated vector (-`self`)."""
-        return self.__class__(-self._x, -self._y, -self._z)
+        return _new_vec3(self.__class__, -self._x, -self._y, -self._z)
 
     __neg__ = reversed
 
@@ -376,7 +443,10 @@ class Vec3:
         `PEP 485 <https://www.python.org/dev/peps/pep-0485/>`_.
 
         """
-        x, y, z = self.decompose(other)
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
         return (
             math.isclose(self._x, x, rel_tol=rel_tol, abs_tol=abs_tol)
             and math.isclose(self._y, y, rel_tol=rel_tol, abs_tol=abs_tol)
@@ -384,14 +454,18 @@ class Vec3:
         )
 
     def __eq__(self, other: UVec) -> bool:
-        """Equal operator.
+        """Equal operator, compares all axis exactly and is consistent with
+        :meth:`__hash__`, use :meth:`isclose` to compare vectors with
+        tolerances.
 
         Args:
             other: :class:`Vec3` compatible object
         """
-        if not isinstance(other, Vec3):
-            other = Vec3(other)
-        return self.x == other.x and self.y == other.y and self.z == other.z
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
+        return self._x == x and self._y == y and self._z == z
 
     def __lt__(self, other: UVec) -> bool:
         """Lower than operator.
@@ -400,7 +474,10 @@ class Vec3:
             other: :class:`Vec3` compatible object
 
         """
-        x, y, z = self.decompose(other)
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
         if self._x == x:
             if self._y == y:
                 return self._z < z
@@ -411,8 +488,11 @@ class Vec3:
 
     def __add__(self, other: UVec) -> Vec3:
         """Add :class:`Vec3` operator: `self` + `other`."""
-        x, y, z = self.decompose(other)
-        return self.__class__(self._x + x, self._y + y, self._z + z)
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
+        return _new_vec3(self.__class__, self._x + x, self._y + y, self._z + z)
 
     def __radd__(self, other: UVec) -> Vec3:
         """RAdd :class:`Vec3` operator: `other` + `self`."""
@@ -420,19 +500,26 @@ class Vec3:
 
     def __sub__(self, other: UVec) -> Vec3:
         """Sub :class:`Vec3` operator: `self` - `other`."""
-
-        x, y, z = self.decompose(other)
-        return self.__class__(self._x - x, self._y - y, self._z - z)
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
+        return _new_vec3(self.__class__, self._x - x, self._y - y, self._z - z)
 
     def __rsub__(self, other: UVec) -> Vec3:
         """RSub :class:`Vec3` operator: `other` - `self`."""
-        x, y, z = self.decompose(other)
-        return self.__class__(x - self._x, y - self._y, z - self._z)
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
+        return _new_vec3(self.__class__, x - self._x, y - self._y, z - self._z)
 
     def __mul__(self, other: float) -> Vec3:
         """Scalar Mul operator: `self` * `other`."""
         scalar = float(other)
-        return self.__class__(self._x * scalar, self._y * scalar, self._z * scalar)
+        return _new_vec3(
+            self.__class__, self._x * scalar, self._y * scalar, self._z * scalar
+        )
 
     def __rmul__(self, other: float) -> Vec3:
         """Scalar RMul operator: `other` * `self`."""
@@ -441,7 +528,9 @@ class Vec3:
     def __truediv__(self, other: float) -> Vec3:
         """Scalar Div operator: `self` / `other`."""
         scalar = float(other)
-        return self.__class__(self._x / scalar, self._y / scalar, self._z / scalar)
+        return _new_vec3(
+            self.__class__, self._x / scalar, self._y / scalar, self._z / scalar
+        )
 
     @staticmethod
     def sum(items: Iterable[UVec]) -> Vec3:
@@ -457,7 +546,10 @@ class Vec3:
         Args:
             other: :class:`Vec3` compatible object
         """
-        x, y, z = self.decompose(other)
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
         return self._x * x + self._y * y + self._z * z
 
     def cross(self, other: UVec) -> Vec3:
@@ -466,8 +558,12 @@ class Vec3:
         Args:
             other: :class:`Vec3` compatible object
         """
-        x, y, z = self.decompose(other)
-        return self.__class__(
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
+        return _new_vec3(
+            self.__class__,
             self._y * z - self._z * y,
             self._z * x - self._x * z,
             self._x * y - self._y * x,
@@ -475,8 +571,11 @@ class Vec3:
 
     def distance(self, other: UVec) -> float:
         """Returns distance between `self` and `other` vector."""
-        v = self.__class__(other)
-        return v.__sub__(self).magnitude
+        if isinstance(other, Vec3):
+            xyz = other._x, other._y, other._z
+        else:
+            xyz = self.decompose(other)
+        return math.dist((self._x, self._y, self._z), xyz)
 
     def angle_between(self, other: UVec) -> float:
         """Returns angle between `self` and `other` in radians. +angle is
@@ -486,7 +585,13 @@ class Vec3:
             other: :class:`Vec3` compatible object
 
         """
-        cos_theta = self.normalize().dot(self.__class__(other).normalize())
+        if isinstance(other, Vec3):
+            x, y, z = other._x, other._y, other._z
+        else:
+            x, y, z = self.decompose(other)
+        cos_theta = (self._x * x + self._y * y + self._z * z) / (
+            self.magnitude * math.hypot(x, y, z)
+        )
         # avoid domain errors caused by floating point imprecision:
         if cos_theta < -1.0:
             cos_theta = -1.0
@@ -517,9 +622,11 @@ class Vec3:
             angle: angle in radians
 
         """
-        v = self.__class__(self.x, self.y, 0.0)
-        v = Vec3.from_angle(v.angle + angle, v.magnitude)
-        return self.__class__(v.x, v.y, self.z)
+        c = math.cos(angle)
+        s = math.sin(angle)
+        x = self._x
+        y = self._y
+        return _new_vec3(self.__class__, c * x - s * y, s * x + c * y, self._z)
 
     def rotate_deg(self, angle: float) -> Vec3:
         """Returns vector rotated about `angle` around the z-axis.
@@ -531,6 +638,19 @@ class Vec3:
         return self.rotate(math.radians(angle))
 
 
+def _new_vec3(cls, x: float, y: float, z: float) -> Vec3:
+    # Fast constructor for float arguments, bypasses Vec3.__init__() and the
+    # argument checking of Vec3.decompose().
+    v = object.__new__(cls)
+    v._x = x
+    v._y = y
+    v._z = z
+    v._mag = None
+    v._unit = None
+    v._hash = None
+    return v
+
+
 X_AXIS = Vec3(1, 0, 0)
 Y_AXIS = Vec3(0, 1, 0)
 Z_AXIS = Vec3(0, 0, 1)
@@ -545,7 +665,7 @@ def distance(p1: UVec, p2: UVec) -> float:
         p2: second point as :class:`Vec3` compatible object
 
     """
-    return Vec3(p1).distance(p2)
+    return math.dist(Vec3.decompose(p1), Vec3.decompose(p2))
 
 
 def lerp(p1: UVec, p2: UVec, factor: float = 0.5) -> Vec3:
@@ -610,11 +730,15 @@ class Vec2:
 
     @classmethod
     def generate(cls, items: Iterable[UVec]) -> Iterator[Vec2]:
+        if isinstance(items, np.ndarray):
+            # converting the rows of numpy arrays is very slow
+            items = items.tolist()
         return (cls(item) for item in items)
 
     @classmethod
     def from_angle(cls, angle: float, length: float = 1.0) -> Vec2:
-        return cls(math.cos(angle) * length, math.sin(angle) * length)
+        length = float(length)
+        return _new_vec2(cls, math.cos(angle) * length, math.sin(angle) * length)
 
     @classmethod
     def from_deg_angle(cls, angle: float, length: float = 1.0) -> Vec2:
@@ -689,9 +813,9 @@ class Vec2:
 
         """
         if ccw:
-            return self.__class__(-self.y, self.x)
+            return _new_vec2(self.__class__, -self.y, self.x)
         else:
-            return self.__class__(self.y, -self.x)
+            return _new_vec2(self.__class__, self.y, -self.x)
 
     def lerp(self, other: AnyVec, factor: float = 0.5) -> Vec2:
         """Linear interpolation between `self` and `other`.
@@ -703,9 +827,10 @@ class Vec2:
         Returns: interpolated vector
 
         """
+        factor = float(factor)
         x = self.x + (other.x - self.x) * factor
         y = self.y + (other.y - self.y) * factor
-        return self.__class__(x, y)
+        return _new_vec2(self.__class__, x, y)
 
     def project(self, other: AnyVec) -> Vec2:
         """Project vector `other` onto `self`."""
@@ -713,10 +838,13 @@ class Vec2:
         return uv * uv.dot(other)
 
     def normalize(self, length: float = 1.0) -> Vec2:
-        return self.__mul__(length / self.magnitude)
+        magnitude = self.magnitude
+        if magnitude == length and magnitude != 0.0:
+            return self  # immutable!
+        return self.__mul__(length / magnitude)
 
     def reversed(self) -> Vec2:
-        return self.__class__(-self.x, -self.y)
+        return _new_vec2(self.__class__, -self.x, -self.y)
 
     __neg__ = reversed
 
@@ -747,30 +875,32 @@ class Vec2:
 
     def __add__(self, other: AnyVec) -> Vec2:
         try:
-            return self.__class__(self.x + other.x, self.y + other.y)
+            return _new_vec2(self.__class__, self.x + other.x, self.y + other.y)
         except AttributeError:
             raise TypeError("invalid argument")
 
     def __sub__(self, other: AnyVec) -> Vec2:
         try:
-            return self.__class__(self.x - other.x, self.y - other.y)
+            return _new_vec2(self.__class__, self.x - other.x, self.y - other.y)
         except AttributeError:
             raise TypeError("invalid argument")
 
     def __rsub__(self, other: AnyVec) -> Vec2:
         try:
-            return self.__class__(other.x - self.x, other.y - self.y)
+            return _new_vec2(self.__class__, other.x - self.x, other.y - self.y)
         except AttributeError:
             raise TypeError("invalid argument")
 
     def __mul__(self, other: float) -> Vec2:
-        return self.__class__(self.x * other, self.y * other)
+        scalar = float(other)
+        return _new_vec2(self.__class__, self.x * scalar, self.y * scalar)
 
     def __rmul__(self, other: float) -> Vec2:
-        return self.__class__(self.x * other, self.y * other)
+        return self.__mul__(other)
 
     def __truediv__(self, other: float) -> Vec2:
-        return self.__class__(self.x / other, self.y / other)
+        scalar = float(other)
+        return _new_vec2(self.__class__, self.x / scalar, self.y / scalar)
 
     def dot(self, other: AnyVec) -> float:
         return self.x * other.x + self.y * other.y
@@ -786,7 +916,9 @@ class Vec2:
         counter-clockwise orientation.
 
         """
-        cos_theta = self.normalize().dot(other.normalize())
+        x = other.x
+        y = other.y
+        cos_theta = (self.x * x + self.y * y) / (self.magnitude * math.hypot(x, y))
         # avoid domain errors caused by floating point imprecision:
         if cos_theta < -1.0:
             cos_theta = -1.0
@@ -801,7 +933,11 @@ class Vec2:
             angle: angle in radians
 
         """
-        return self.__class__.from_angle(self.angle + angle, self.magnitude)
+        c = math.cos(angle)
+        s = math.sin(angle)
+        x = self.x
+        y = self.y
+        return _new_vec2(self.__class__, c * x - s * y, s * x + c * y)
 
     def rotate_deg(self, angle: float) -> Vec2:
         """Rotate vector around origin.
@@ -812,9 +948,7 @@ class Vec2:
         Returns: rotated vector
 
         """
-        return self.__class__.from_angle(
-            self.angle + math.radians(angle), self.magnitude
-        )
+        return self.rotate(math.radians(angle))
 
     @staticmethod
     def sum(items: Iterable[Vec2]) -> Vec2:
@@ -823,3 +957,12 @@ class Vec2:
         for v in items:
             s += v
         return s
+
+
+def _new_vec2(cls, x: float, y: float) -> Vec2:
+    # Fast constructor for float arguments, bypasses the attribute lookup and
+    # exception handling of Vec2.__init__().
+    v = object.__new__(cls)
+    v.x = x
+    v.y = y
+    return v
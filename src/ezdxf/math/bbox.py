@@ -441,7 +441,7 @@ class BoundingBox2d(AbstractBoundingBox[Vec2]):
 
 def extents3d(vertices: Iterable[UVec]) -> tuple[Vec3, Vec3]:
     """Returns the extents of the bounding box as tuple (extmin, extmax)."""
-    vertices = np.array([Vec3(v).xyz for v in vertices], dtype=np.float64)
+    vertices = Vec3.array(vertices)
     if len(vertices):
         return Vec3(vertices.min(0)), Vec3(vertices.max(0))
     else:
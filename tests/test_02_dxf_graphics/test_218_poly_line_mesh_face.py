@@ -3,7 +3,7 @@
 import pytest
 
 from ezdxf.lldxf.const import VTX_3D_POLYLINE_VERTEX
-from ezdxf import DXFIndexError
+from ezdxf import DXFIndexError, DXFValueError
 from ezdxf.layouts import VirtualLayout
 
 
@@ -105,6 +105,19 @@ def test_polymesh_set_vertex(msp):
     assert (1, 2, 3) == result
 
 
+def test_polymesh_set_vertices(msp):
+    mesh = msp.add_polymesh((2, 3))
+    mesh.set_mesh_vertices([(m, n, m * n) for m in range(2) for n in range(3)])
+    assert mesh.get_mesh_vertex((0, 2)).dxf.location == (0, 2, 0)
+    assert mesh.get_mesh_vertex((1, 2)).dxf.location == (1, 2, 2)
+
+
+def test_polymesh_set_vertices_invalid_count(msp):
+    mesh = msp.add_polymesh((2, 2))
+    with pytest.raises(DXFValueError):
+        mesh.set_mesh_vertices([(0, 0, 0)] * 3)
+
+
 def test_polymesh_error_nindex(msp):
     mesh = msp.add_polymesh((4, 4))
     with pytest.raises(DXFIndexError):
@@ -3,6 +3,7 @@
 import pytest
 import math
 import pickle
+import numpy as np
 
 # Import from 'ezdxf.math._vector' to test Python implementation
 from ezdxf.math._vector import Vec3
@@ -85,6 +86,32 @@ def test_usage_as_tuple(vec3):
     assert v.xyz == (1, 2, 3)
 
 
+def test_array(vec3):
+    a = vec3.array([(1, 2), vec3(3, 4, 5), [6, 7, 8]])
+    assert a.shape == (3, 3)
+    assert a.dtype == np.float64
+    assert a.tolist() == [[1, 2, 0], [3, 4, 5], [6, 7, 8]]
+
+
+def test_array_of_empty_input(vec3):
+    assert vec3.array([]).shape == (0, 3)
+
+
+def test_array_from_numpy_array(vec3):
+    a = np.array([(1, 2), (3, 4)])
+    assert vec3.array(a).tolist() == [[1, 2, 0], [3, 4, 0]]
+    b = vec3.array(np.array([(1, 2, 3)]))
+    assert b.dtype == np.float64
+    assert b.tolist() == [[1, 2, 3]]
+
+
+def test_list_from_numpy_array(vec3):
+    vectors = vec3.list(np.array([(1, 2, 3), (4, 5, 6)]))
+    assert all(isinstance(v, vec3) for v in vectors)
+    assert vectors == [(1, 2, 3), (4, 5, 6)]
+    assert vec3.tuple(np.array([(1, 2)])) == (vec3(1, 2, 0),)
+
+
 def test_get_item_positive_index(vec3):
     v = vec3(1, 2, 3)
     assert v[0] == 1
@@ -134,6 +161,32 @@ def test_deep_copy(vec3):
     assert l3[0] is l1[0], "Vec3 is immutable"
 
 
+def test_python_vec3_caches_magnitude_and_unit_vector():
+    v = Vec3(3, 4, 0)
+    assert v.magnitude == 5
+    unit = v.normalize()
+    assert unit.isclose((0.6, 0.8, 0))
+    assert v.normalize() is unit
+    assert v.normalize(2).isclose((1.2, 1.6, 0))
+
+
+def test_python_vec3_caches_hash_value():
+    v = Vec3(1, 2, 3)
+    assert v._hash is None
+    h = hash(v)
+    assert h == hash((1.0, 2.0, 3.0))
+    assert v._hash == h
+    w = v + (1, 0, 0)
+    assert w._hash is None, "new vectors have no cached hash value"
+    assert hash(w) == hash((2.0, 2.0, 3.0))
+
+
+def test_python_vec3_pickle_does_not_restore_hash_value():
+    v = Vec3(1, 2, 3)
+    hash(v)
+    assert pickle.loads(pickle.dumps(v))._hash is None
+
+
 def test_get_angle(vec3):
     v = vec3(3, 3)
     assert math.isclose(v.angle_deg, 45)
@@ -156,6 +209,24 @@ def test_compare_vectors(vec3):
     assert v1 < v2
 
 
+def test_equal_vectors_have_equal_hashes(vec3):
+    v1 = vec3(1, 2, 3)
+    v2 = vec3(1.0, 2.0, 3.0)
+    assert v1 == v2
+    assert hash(v1) == hash(v2)
+    assert hash(v1) == hash((1, 2, 3))
+    assert vec3(-0.0, 0, 0) == vec3(0, 0, 0)
+    assert hash(vec3(-0.0, 0, 0)) == hash(vec3(0, 0, 0))
+
+
+def test_compare_is_exact(vec3):
+    v1 = vec3(1, 2, 3)
+    v2 = vec3(1, 2, 3 + 1e-15)
+    assert v1 != v2
+    assert v1.isclose(v2)
+    assert len({v1, v2, vec3(1, 2, 3)}) == 2
+
+
 def test_xy(vec3):
     assert vec3(1, 2, 3).xy == vec3(1, 2)
 
@@ -214,11 +285,23 @@ def test_normalize_to_length(vec3):
     assert v.normalize(4) == (4, 0, 0)
 
 
+def test_normalize_returns_self_if_length_matches(vec3):
+    v = vec3(0, 1, 0)
+    assert v.normalize() is v
+    v = vec3(0, 0, 3)
+    assert v.normalize(3) is v
+
+
 def test_normalize_error(vec3):
     with pytest.raises(ZeroDivisionError):
         vec3().normalize()
 
 
+def test_normalize_null_vector_to_zero_length_raises_error(vec3):
+    with pytest.raises(ZeroDivisionError):
+        vec3().normalize(0)
+
+
 def test_orthogonal_ccw(vec3):
     v = vec3(3, 4)
     assert v.orthogonal() == (-4, 3)
@@ -284,6 +367,10 @@ def test_sub_scalar_type_error(vec3):
         vec3(2, 3, 4) - 3
 
 
+def test_rsub_2d_tuple(vec3):
+    assert (1, 1) - vec3(2, 3, 4) == (-1, -2, -4)
+
+
 def test_rsub_scalar_vector_type_error(vec3):
     with pytest.raises(TypeError):
         7 - vec3(2, 3, 4)
@@ -384,6 +471,21 @@ def test_angle_deg(vec3):
     assert math.isclose(vec3(-1, 1).angle_deg, 135)
 
 
+def test_distance(vec3):
+    v1 = vec3(1, 2, 3)
+    assert v1.distance(vec3(4, 6, 3)) == 5
+    assert v1.distance((4, 6, 3)) == 5
+    assert v1.distance((1, 2)) == 3
+    assert v1.distance(v1) == 0
+
+
+def test_distance_function():
+    from ezdxf.math._vector import distance
+
+    assert distance((1, 2, 3), (4, 6, 3)) == 5
+    assert distance(Vec3(1, 2), (1, 2)) == 0
+
+
 def test_angle_between(vec3):
     v1 = vec3(0, 1)
     v2 = vec3(1, 1)
@@ -445,6 +547,14 @@ def test_rot_z(vec3):
     assert vec3(2, 2, 7).rotate_deg(90).isclose((-2, 2, 7))
 
 
+def test_rot_z_by_zero_angle_is_exact(vec3):
+    assert vec3(3, 4, 7).rotate(0) == (3, 4, 7)
+
+
+def test_rot_z_of_vector_in_z_direction(vec3):
+    assert vec3(0, 0, 7).rotate(1.5) == (0, 0, 7)
+
+
 def test_lerp(vec3):
     v1 = vec3(1, 1, 1)
     v2 = vec3(4, 4, 4)
@@ -484,6 +594,34 @@ def test_picklable(vec3):
         assert type(v) is type(pickled_v)
 
 
+def test_python_vec3_pickle_does_not_store_caches():
+    v = Vec3(3, 4, 0)
+    data = pickle.dumps(v)
+    v.normalize()
+    assert pickle.dumps(v) == data
+    pickled_v = pickle.loads(data)
+    assert pickled_v.magnitude == 5
+
+
+# Vec3(1, 2, 3) pickled by a Vec3 class without __reduce__() and caches,
+# which stores only the slots _x, _y and _z as state:
+SLOTS_STATE_PICKLE = (
+    b"\x80\x04\x95T\x00\x00\x00\x00\x00\x00\x00\x8c\x12ezdxf.math._vector"
+    b"\x94\x8c\x04Vec3\x94\x93\x94)\x81\x94N}\x94(\x8c\x02_x\x94G?\xf0"
+    b"\x00\x00\x00\x00\x00\x00\x8c\x02_y\x94G@\x00\x00\x00\x00\x00\x00"
+    b"\x00\x8c\x02_z\x94G@\x08\x00\x00\x00\x00\x00\x00u\x86\x94b."
+)
+
+
+def test_python_vec3_loads_pickle_with_slots_state():
+    v = pickle.loads(SLOTS_STATE_PICKLE)
+    assert type(v) is Vec3
+    assert v == (1, 2, 3)
+    assert math.isclose(v.magnitude, math.sqrt(14))
+    assert v.normalize().isclose(Vec3(1, 2, 3).normalize())
+    assert hash(v) == hash(Vec3(1, 2, 3))
+
+
 def test_is_equal(vec3):
     v1 = 1.23456789
     assert vec3(v1, v1, v1) == vec3(v1, v1, v1)
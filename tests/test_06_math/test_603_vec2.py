@@ -3,6 +3,7 @@
 import pytest
 import math
 import pickle
+import numpy as np
 
 # Import from 'ezdxf.math._vector' to test Python implementation
 from ezdxf.math._vector import Vec2, Vec3
@@ -36,6 +37,12 @@ def test_init_tuple(vcls):
     assert v.y == 3
 
 
+def test_list_from_numpy_array(vcls):
+    vectors = vcls.list(np.array([(1, 2), (3, 4)]))
+    assert all(isinstance(v, vcls) for v in vectors)
+    assert vectors == [(1, 2), (3, 4)]
+
+
 def test_empty_init(vcls):
     v = vcls()
     assert v.x == 0.
@@ -178,6 +185,13 @@ def test_normalize_to_length(vcls):
     assert v.normalize(4) == (4, 0)
 
 
+def test_normalize_error(vcls):
+    with pytest.raises(ZeroDivisionError):
+        vcls().normalize()
+    with pytest.raises(ZeroDivisionError):
+        vcls(0, 0).normalize(0)
+
+
 def test_orthogonal_ccw(vcls):
     v = vcls(3, 4)
     assert v.orthogonal() == (-4, 3)